@@ -1,36 +1,79 @@
 import os
+from functools import lru_cache
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
 from langchain_openai import ChatOpenAI
 
-def init_chat_model():
+
+@lru_cache(maxsize=1)
+def _enable_llm_cache() -> None:
+    """
+    Install LangChain's exact-match LLM cache (once per process).
+
+    The cache fingerprints each call on the serialized messages plus the
+    model configuration, so repeated identical turns (e.g. the planner
+    re-deriving the same "explore then plan" step on the same repo)
+    return the cached AIMessage instead of spending tokens. Set
+    BUDDYCODE_LLM_CACHE=0 to disable. With temperature=0 the cached
+    answer matches what the API would return anyway.
+    """
+    if os.getenv("BUDDYCODE_LLM_CACHE", "1") != "0":
+        set_llm_cache(InMemoryCache())
+
+
+@lru_cache(maxsize=None)
+def init_chat_model(parallel_tool_calls: bool = False):
     """
     Initialize the ChatOpenAI model for Doubao (豆包).
 
+    The instance is cached per configuration, so repeated callers (agent
+    construction, examples, tests) share a single client instead of
+    rebuilding the HTTP connection pool each time.
+
+    Args:
+        parallel_tool_calls: Ask the API to emit independent tool calls
+            in one response instead of one call per round trip. Only set
+            this for callers that always bind tools (e.g. the agent);
+            the flag is invalid on requests without tools.
+
     Environment variables (optional):
     - OPENAI_API_KEY: ByteDance ARK API key (defaults to hardcoded value for local dev)
     - OPENAI_BASE_URL: API base URL (defaults to Beijing endpoint)
     - OPENAI_MODEL: Model endpoint ID (defaults to ep-20251010103732-rchjc)
     """
+    _enable_llm_cache()
+
     # Get configuration from environment or use defaults
     api_key = os.getenv("OPENAI_API_KEY")
     base_url = os.getenv("OPENAI_BASE_URL")
     model = os.getenv("OPENAI_MODEL")
 
+    extra_body = {
+        "thinking": {
+            "type": "disabled"  # 如果需要推理，这里可以设置为 "auto"
+        }
+    }
+    if parallel_tool_calls:
+        extra_body["parallel_tool_calls"] = True
+
     return ChatOpenAI(
         model=model,
         base_url=base_url,
         api_key=api_key,
         temperature=0,
         max_tokens=8 * 1024,
-        extra_body={
-            "thinking": {
-                "type": "disabled"  # 如果需要推理，这里可以设置为 "auto"
-            }
-        }
+        extra_body=extra_body,
     )
 
 
 if __name__ == "__main__":
+    import sys
+
     chat_model = init_chat_model()
+    # Accumulate chunks in a bytearray and flush with one buffered write
+    # instead of a flushed print (write + flush syscalls) per token.
+    buffer = bytearray()
     for chunk in chat_model.stream("你好"):
-        print(chunk.content, end="", flush=True)
-    print()  # New line at the end
+        buffer += chunk.content.encode("utf-8")
+    buffer += b"\n"  # New line at the end
+    sys.stdout.buffer.write(buffer)
@@ -8,18 +8,28 @@ This agent uses the Doubao chat model and file system tools to help with:
 - Finding and fixing bugs
 - Running tests and builds
 """
+import asyncio
 import os
+import sys
+import traceback
+from functools import lru_cache
 from langchain.agents import create_agent
 from langchain.tools import BaseTool
 # from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.memory import InMemorySaver
 from buddycode.chat_model import init_chat_model
-from buddycode.tools import get_file_system_tools
+from buddycode.tools import TreeTool, get_file_system_tools
 
 
-# Detailed system prompt
-SYSTEM_PROMPT = f"""---
-PROJECT_ROOT: {os.getcwd()}
+# Base tool set shared by every agent built in this process;
+# get_file_system_tools() is cached and already returns a frozen tuple.
+_FS_TOOLS = get_file_system_tools()
+
+
+# Detailed system prompt template; the project root is substituted once
+# per root by _system_prompt() instead of at import time.
+_SYSTEM_PROMPT_TEMPLATE = """---
+PROJECT_ROOT: {root}
 ---
 
 As a ReAct coding agent, interpret user instructions and execute them using the most suitable tool.
@@ -52,6 +62,7 @@ It is important to skip using the `todo` tool when:
 - Always provide a brief explanation before invoking any tool so users understand your thought process.
 - Never access or modify files at any path unless the path has been explicitly inspected or provided by the user.
 - If a tool call fails or produces unexpected output, validate what happened in 1-2 lines, and suggest an alternative or solution.
+- When you need multiple independent pieces of information (e.g. ls + grep + tree), call all the relevant tools in a single response so they run in parallel; only call sequentially when a later call depends on an earlier result.
 - If clarification or more information from the user is required, request it before proceeding.
 - Ensure all feedback to the user is clear and relevant—include file paths, line numbers, or results as needed.
 - Before you present the final result to the user, **make sure** all the todos are completed.
@@ -66,6 +77,75 @@ It is important to skip using the `todo` tool when:
 """
 
 
+@lru_cache(maxsize=1)
+def _system_prompt(root: str) -> str:
+    """Render the system prompt for a project root (cached per root)."""
+    return _SYSTEM_PROMPT_TEMPLATE.format(root=root)
+
+
+def _project_root() -> str:
+    """Project root for the prompt: PROJECT_ROOT env override, else cwd."""
+    return os.environ.get("PROJECT_ROOT") or os.getcwd()
+
+
+def __getattr__(name: str):
+    # SYSTEM_PROMPT stays importable (tests and callers reference it) but
+    # is now rendered on first access instead of at import time.
+    if name == "SYSTEM_PROMPT":
+        return _system_prompt(_project_root())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def _dir_snapshot(root: str, max_chars: int = 4000) -> str:
+    """
+    Depth-2 directory snapshot for the system prompt (cached per root).
+
+    The prompt tells the model its first action should be exploring the
+    project; capturing the tree up front and handing it over as initial
+    context lets a fresh session skip that whole first LLM round trip.
+
+    Caching matters beyond skipping the tree walk: OpenAI-compatible
+    endpoints (including ARK) prefix-cache the prompt KV automatically,
+    but only when the prefix is byte-identical across requests. Freezing
+    the snapshot keeps every agent built in this process sending the
+    same system-message prefix, so later turns and tests reuse the
+    cached prefill instead of re-paying it.
+    """
+    snapshot = TreeTool()._run(path=root, max_depth=2)
+    if snapshot.startswith("Error"):
+        return ""
+    if len(snapshot) > max_chars:
+        snapshot = snapshot[:max_chars] + "\n... (truncated)"
+    return snapshot
+
+
+def _make_checkpointer():
+    """
+    Build the default checkpointer for the agent.
+
+    When BUDDYCODE_CKPT_DIR is set and langgraph-checkpoint-sqlite is
+    installed, checkpoints go to a SQLite file there, so conversations
+    survive restarts and avoid the per-step full-state dict copies of the
+    in-memory saver. Otherwise fall back to InMemorySaver.
+    """
+    ckpt_dir = os.environ.get("BUDDYCODE_CKPT_DIR")
+    if ckpt_dir:
+        try:
+            import sqlite3
+            from langgraph.checkpoint.sqlite import SqliteSaver
+        except ImportError:
+            pass
+        else:
+            os.makedirs(ckpt_dir, exist_ok=True)
+            conn = sqlite3.connect(
+                os.path.join(ckpt_dir, "checkpoints.sqlite"),
+                check_same_thread=False,
+            )
+            return SqliteSaver(conn)
+    return InMemorySaver()
+
+
 def create_coding_agent(plugin_tools: list[BaseTool] = [], **kwargs):
     """
     Create a coding agent for React development.
@@ -85,23 +165,51 @@ def create_coding_agent(plugin_tools: list[BaseTool] = [], **kwargs):
         # Normal call
         pass
 
-    # Get all file system tools
-    tools = get_file_system_tools()
+    # Use the frozen base tool set
+    tools = _FS_TOOLS
+
+    # Speculative first-turn observation: hand the model a directory
+    # snapshot up front so a fresh session skips the initial explore
+    # round trip.
+    root = _project_root()
+    system_prompt = _system_prompt(root)
+    snapshot = _dir_snapshot(root)
+    if snapshot:
+        system_prompt += (
+            "\n## Directory Snapshot (depth 2, captured at session start)\n\n"
+            f"{snapshot}\n\n"
+            "Treat this snapshot as your initial exploration result; re-run "
+            "tree/ls only if it looks stale or you need more depth.\n"
+        )
 
     # Create the agent
     return create_agent(
-        model=init_chat_model(),
+        # 并行工具调用：一次响应里返回多个独立的 tool call
+        model=init_chat_model(parallel_tool_calls=True),
         tools=[
             *tools,  # Unpack file system tools
             *plugin_tools,  # 为将来的扩展性做准备（如 MCP 工具）
         ],
-        system_prompt=SYSTEM_PROMPT,
+        system_prompt=system_prompt,
         name="react_coding_agent",
+        checkpointer=kwargs.pop("checkpointer", None) or _make_checkpointer(),
         **kwargs,
-        checkpointer=InMemorySaver(),
     )
 
 
+@lru_cache(maxsize=1)
+def _compiled_graph():
+    """
+    Compiled agent graph with the default tool set, built once.
+
+    LangGraph API calls the factory per request; rebuilding the tools,
+    the model client and recompiling the StateGraph each time dominates
+    request latency. Conversation state lives in the checkpointer keyed
+    by thread_id, so sharing one compiled graph across requests is safe.
+    """
+    return create_coding_agent()
+
+
 from langgraph.checkpoint.base import RunnableConfig
 # LangGraph API compatible factory function
 def create_graph(config: RunnableConfig = None):
@@ -116,13 +224,112 @@ def create_graph(config: RunnableConfig = None):
         config: RunnableConfig from LangGraph (optional, can be None)
 
     Returns:
-        Compiled agent graph
+        Compiled agent graph (cached; compiled on first call)
     """
-    return create_coding_agent()
+    return _compiled_graph()
 
 
-def main():
-    """Example usage of the React agent with interactive mode."""
+async def _batched(aiter, max_items: int = 32, max_wait: float = 0.02):
+    """
+    Group an async iterator's items into small batches.
+
+    Yields a batch once max_items have arrived or max_wait seconds have
+    passed since the batch's first item, so the downstream write/flush
+    syscall is amortized over many tokens without hurting perceived
+    latency. The pending __anext__ is kept as a task across timeouts so
+    the source generator is never cancelled mid-step.
+    """
+    it = aiter.__aiter__()
+    loop = asyncio.get_running_loop()
+    nxt = None
+    batch = []
+    deadline = 0.0
+    while True:
+        if nxt is None:
+            nxt = asyncio.ensure_future(it.__anext__())
+
+        timeout = None if not batch else deadline - loop.time()
+        if timeout is not None and timeout <= 0:
+            yield batch
+            batch = []
+            continue
+
+        done, _pending = await asyncio.wait({nxt}, timeout=timeout)
+        if not done:
+            yield batch
+            batch = []
+            continue
+
+        try:
+            item = nxt.result()
+        except StopAsyncIteration:
+            break
+        finally:
+            nxt = None
+
+        if not batch:
+            deadline = loop.time() + max_wait
+        batch.append(item)
+        if len(batch) >= max_items:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+async def _stream_turn(agent, user_input: str, config: dict) -> str:
+    """
+    Stream one agent turn token-by-token and return the final text.
+
+    stream_mode="messages" yields token deltas instead of the whole
+    accumulated state per step, so output appears as it is generated and
+    each turn avoids re-serializing the full message history.
+    """
+    parts = []
+    stream = agent.astream(
+        {"messages": [("user", user_input)]}, config, stream_mode="messages"
+    )
+    # Batch chunks so stdout is written/flushed once per batch of tokens
+    # instead of once per token.
+    async for batch in _batched(stream):
+        text = "".join(
+            msg.content
+            for msg, _meta in batch
+            if getattr(msg, "content", "") and msg.type != "tool"
+        )
+        if text:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            parts.append(text)
+    return "".join(parts)
+
+
+def _make_prompt_reader():
+    """
+    Build an async input reader for the interactive loop.
+
+    Uses prompt_toolkit's prompt_async when available so the event loop
+    stays free while the user types (checkpoint writes and connection
+    keep-alives keep progressing); otherwise falls back to running the
+    built-in input() in a worker thread.
+    """
+    try:
+        from prompt_toolkit import PromptSession
+    except ImportError:
+        async def read_input(prompt: str) -> str:
+            return (await asyncio.to_thread(input, prompt)).strip()
+    else:
+        session = PromptSession()
+
+        async def read_input(prompt: str) -> str:
+            return (await session.prompt_async(prompt)).strip()
+
+    return read_input
+
+
+async def _amain():
+    """Async body of the interactive REPL."""
     print("=" * 70)
     print("React Code Agent - Powered by Doubao (豆包)")
     print("=" * 70)
@@ -150,45 +357,50 @@ def main():
     # Thread ID for conversation continuity
     config = {"configurable": {"thread_id": "default"}}
 
+    read_input = _make_prompt_reader()
+
     while True:
         try:
-            user_input = input("\n👤 你: ").strip()
-
-            if user_input.lower() in ['quit', 'exit', 'q', '退出']:
-                print("\n👋 再见！")
-                break
-
-            if not user_input:
-                continue
-
-            print("\n🤔 Agent 正在思考...")
-
-            # Run the agent with streaming output
-            for chunk in agent.stream({"messages": [("user", user_input)]}, config, stream_mode="values"):
-                # Print intermediate steps if available
-                if "messages" in chunk:
-                    last_message = chunk["messages"][-1]
-                    if hasattr(last_message, 'content') and last_message.content:
-                        print(f"\r🤖 Agent: {last_message.content[:100]}...", end="", flush=True)
-
-            # Get final result
-            print("\n")
-            print("=" * 70)
-            print("✅ 最终结果：")
-            print("-" * 70)
-            if "messages" in chunk:
-                last_message = chunk["messages"][-1]
-                print(last_message.content)
-            print("=" * 70)
+            user_input = await read_input("\n👤 你: ")
+        except (KeyboardInterrupt, EOFError):
+            print("\n\n⚠️ 中断！再见！")
+            break
+
+        if user_input.lower() in ['quit', 'exit', 'q', '退出']:
+            print("\n👋 再见！")
+            break
 
+        if not user_input:
+            continue
+
+        print("\n🤔 Agent 正在思考...\n")
+
+        # Run the agent with token-level streaming output; only this call
+        # needs the broad error handler, so the rest of the loop stays on
+        # the straight-line path.
+        try:
+            final_text = await _stream_turn(agent, user_input, config)
         except KeyboardInterrupt:
             print("\n\n⚠️ 中断！再见！")
             break
         except Exception as e:
             print(f"\n❌ 错误: {e}")
-            import traceback
             traceback.print_exc()
             print("请重试...")
+            continue
+
+        # Get final result
+        print("\n")
+        print("=" * 70)
+        print("✅ 最终结果：")
+        print("-" * 70)
+        print(final_text)
+        print("=" * 70)
+
+
+def main():
+    """Example usage of the React agent with interactive mode."""
+    asyncio.run(_amain())
 
 
 if __name__ == "__main__":
@@ -10,14 +10,66 @@ This module provides LangChain-compatible tools for common file system operation
 - todo: Manage a todo list
 """
 
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+import fnmatch
+from functools import lru_cache, partial
+import mmap
 import os
 import re
+import shlex
 import subprocess
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import ClassVar, Optional, List, Dict, Any
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    # Optional Google RE2 binding: compiles to a DFA and scans in linear
+    # time, immune to catastrophic backtracking on pathological patterns.
+    import re2
+except ImportError:
+    re2 = None
+
+
+# Dedicated worker pool for blocking tool bodies, created on first async
+# tool call. Keeping tools off the event loop's default executor means a
+# burst of parallel tool calls cannot starve other run_in_executor users
+# (and vice versa). Tool work is I/O-bound, so the pool is sized well
+# above the CPU count.
+_TOOL_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _tool_executor() -> ThreadPoolExecutor:
+    """Return the shared tool worker pool, creating it lazily."""
+    global _TOOL_EXECUTOR
+    if _TOOL_EXECUTOR is None:
+        _TOOL_EXECUTOR = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 4) * 4),
+            thread_name_prefix="buddycode-tool",
+        )
+    return _TOOL_EXECUTOR
+
+
+class ThreadedToolMixin:
+    """Run the synchronous tool body in a worker thread for async callers.
+
+    When the model emits several independent tool calls in one turn, the
+    agent's ToolNode executes them through the async path. Delegating the
+    blocking file/subprocess work to the shared tool pool lets those
+    calls run concurrently instead of serializing on the event loop.
+    """
+
+    async def _arun(self, *args, **kwargs) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _tool_executor(), partial(self._run, *args, **kwargs)
+        )
 
 
 class LsInput(BaseModel):
@@ -28,7 +80,7 @@ class LsInput(BaseModel):
     recursive: bool = Field(default=False, description="List subdirectories recursively")
 
 
-class LsTool(BaseTool):
+class LsTool(ThreadedToolMixin, BaseTool):
     """Tool for listing directory contents."""
 
     name: str = "ls"
@@ -44,7 +96,7 @@ class LsTool(BaseTool):
     ) -> str:
         """Execute ls operation."""
         try:
-            target_path = Path(path).expanduser().resolve()
+            target_path = _resolve(path)
 
             if not target_path.exists():
                 return f"Error: Path '{path}' does not exist"
@@ -54,40 +106,58 @@ class LsTool(BaseTool):
 
             results = []
 
-            def list_directory(dir_path: Path, prefix: str = "") -> None:
+            def list_directory(dir_path: str, prefix: str = "") -> None:
                 """List contents of a directory."""
                 try:
-                    items = sorted(dir_path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-
-                    for item in items:
-                        # Skip hidden files if not requested
-                        if not show_hidden and item.name.startswith('.'):
-                            continue
-
-                        if long_format:
-                            # Show detailed information
-                            stat = item.stat()
-                            size = stat.st_size
-                            modified = stat.st_mtime
-                            is_dir = item.is_dir()
-                            perms = oct(stat.st_mode)[-3:]
-
-                            from datetime import datetime
-                            mod_time = datetime.fromtimestamp(modified).strftime("%Y-%m-%d %H:%M:%S")
-
-                            item_type = "DIR" if is_dir else "FILE"
-                            results.append(f"{prefix}{perms} {item_type:4} {size:>10} {mod_time} {item.name}")
-                        else:
-                            # Simple format
-                            suffix = "/" if item.is_dir() else ""
-                            results.append(f"{prefix}{item.name}{suffix}")
-
-                        # Recurse into subdirectories if requested
-                        if recursive and item.is_dir():
-                            list_directory(item, prefix=prefix + "  ")
-
+                    # os.scandir yields DirEntry objects whose type comes
+                    # from the readdir d_type, so is_dir() needs no extra
+                    # stat syscall per entry.
+                    # Decorate-sort-undecorate: the is_dir/lower keys are
+                    # computed once per entry instead of on every
+                    # comparison (the index breaks case-folded ties so
+                    # DirEntry objects are never compared).
+                    with os.scandir(dir_path) as it:
+                        decorated = [
+                            (not e.is_dir(follow_symlinks=False), e.name.lower(), i, e)
+                            for i, e in enumerate(it)
+                        ]
+                    decorated.sort()
+                    items = [e for _, _, _, e in decorated]
                 except PermissionError:
                     results.append(f"{prefix}[Permission Denied]")
+                    return
+
+                for entry in items:
+                    # Skip hidden files if not requested
+                    if not show_hidden and entry.name.startswith('.'):
+                        continue
+
+                    is_dir = entry.is_dir(follow_symlinks=False)
+
+                    if long_format:
+                        # Show detailed information. DirEntry.stat caches
+                        # the result on the entry, and follow_symlinks=False
+                        # matches ls -l semantics without an extra stat of
+                        # the link target.
+                        stat = entry.stat(follow_symlinks=False)
+                        size = stat.st_size
+                        modified = stat.st_mtime
+                        perms = oct(stat.st_mode)[-3:]
+
+                        # time.strftime avoids building a datetime object
+                        # per entry just to format a timestamp.
+                        mod_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(modified))
+
+                        item_type = "DIR" if is_dir else "FILE"
+                        results.append(f"{prefix}{perms} {item_type:4} {size:>10} {mod_time} {entry.name}")
+                    else:
+                        # Simple format
+                        suffix = "/" if is_dir else ""
+                        results.append(f"{prefix}{entry.name}{suffix}")
+
+                    # Recurse into subdirectories if requested
+                    if recursive and is_dir:
+                        list_directory(entry.path, prefix=prefix + "  ")
 
             list_directory(target_path)
 
@@ -101,17 +171,124 @@ class LsTool(BaseTool):
             return f"Error: {str(e)}"
 
 
+@lru_cache(maxsize=1024)
+def _resolve_bucketed(path_str: str, cwd: str, bucket: int) -> Path:
+    return Path(path_str).expanduser().resolve()
+
+
+def _resolve(path_str) -> Path:
+    """Resolve a user-supplied path, memoized for a few seconds.
+
+    resolve() lstats every path component to canonicalize symlinks, and
+    an agent session hammers the same handful of paths. Entries are
+    keyed on the cwd (relative paths) and a 5-second monotonic bucket so
+    renames and symlink changes are still picked up quickly.
+    """
+    return _resolve_bucketed(str(path_str), os.getcwd(), int(time.monotonic() / 5))
+
+
+# Directories never worth descending into during recursive scans:
+# VCS metadata, dependency caches and build output.
+_IGNORED_DIRS = frozenset({
+    'node_modules', '__pycache__', 'venv', '.git', '.hg', '.svn',
+    'dist', 'build', 'target',
+})
+
+
+# Files larger than this are skipped by grep; they are almost never the
+# source files a search is after and dominate scan time when present.
+_MAX_GREP_FILE_SIZE = 10 * 1024 * 1024
+
+# Size of the probe read used to detect binary files before a full read.
+_BINARY_PROBE_SIZE = 4096
+
+# Cap on captured bash output per stream; a chatty command keeps running
+# but everything beyond the cap is drained and discarded.
+_MAX_BASH_OUTPUT = 1024 * 1024
+
+# Characters that require a shell to interpret the command (pipes,
+# redirection, globbing, variable expansion, quoting, ...). Commands
+# without any of these are exec'd directly, skipping the /bin/sh fork.
+_SHELL_METACHARS = frozenset('|&;<>()$`\\"\'*?[]{}~!#\n')
+
+# Parent directories already ensured by EditTool._create; skips the
+# mkdir -p syscalls when many files land in the same directory. Bounded
+# with FIFO eviction (dict preserves insertion order).
+_MKDIR_SEEN: Dict[str, None] = {}
+_MKDIR_SEEN_MAX = 4096
+
+# Recently read file contents for EditTool, keyed by path and stamped
+# with the stat fingerprint (mtime_ns, size) so any on-disk change
+# invalidates the entry. Agents typically view a file and edit it
+# moments later; the cache turns the second read into a dict hit.
+_FILE_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_FILE_CACHE_MAX = 32
+
+
+def _cache_store(key: str, st: os.stat_result, content: str) -> None:
+    """Insert or refresh a _FILE_CACHE entry, evicting the oldest past the cap."""
+    _FILE_CACHE[key] = (st.st_mtime_ns, st.st_size, content)
+    _FILE_CACHE.move_to_end(key)
+    if len(_FILE_CACHE) > _FILE_CACHE_MAX:
+        _FILE_CACHE.popitem(last=False)
+
+
+def _read_cached(path: Path) -> str:
+    """Read a text file through _FILE_CACHE (validated by mtime/size)."""
+    st = path.stat()
+    key = str(path)
+    entry = _FILE_CACHE.get(key)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        _FILE_CACHE.move_to_end(key)
+        return entry[2]
+    content = path.read_text(encoding='utf-8')
+    _cache_store(key, st, content)
+    return content
+
+
+if hasattr(mmap, 'PROT_READ'):
+    def _mmap_readonly(fileno: int) -> mmap.mmap:
+        """Map a file read-only, prefaulted with MAP_POPULATE where available."""
+        flags = mmap.MAP_PRIVATE | getattr(mmap, 'MAP_POPULATE', 0)
+        return mmap.mmap(fileno, 0, flags=flags, prot=mmap.PROT_READ)
+else:
+    def _mmap_readonly(fileno: int) -> mmap.mmap:
+        """Map a file read-only (non-POSIX fallback)."""
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern, flags: int) -> re.Pattern:
+    """Compile a regex pattern, reusing previously compiled patterns.
+
+    Bounded LRU so an agent looping over the same handful of patterns
+    never recompiles, while a long session with many one-off patterns
+    cannot grow the cache without limit.
+
+    When the optional re2 module is installed, patterns compile to its
+    linear-time engine; constructs RE2 rejects (backreferences,
+    lookaround) fall back to the stdlib backtracking engine.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, flags)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
 class GrepInput(BaseModel):
     """Input schema for grep tool."""
     pattern: str = Field(description="Regular expression pattern to search for")
     path: str = Field(default=".", description="File or directory path to search in")
     file_pattern: Optional[str] = Field(default=None, description="Filter files by glob pattern (e.g., '*.py', '*.txt')")
     case_insensitive: bool = Field(default=False, description="Perform case-insensitive search")
+    literal: bool = Field(default=False, description="Treat pattern as a literal string instead of a regex (faster for plain text)")
     context_lines: int = Field(default=0, description="Number of context lines to show before and after match")
     max_results: int = Field(default=100, description="Maximum number of results to return")
 
 
-class GrepTool(BaseTool):
+class GrepTool(ThreadedToolMixin, BaseTool):
     """Tool for searching text patterns in files."""
 
     name: str = "grep"
@@ -124,95 +301,168 @@ class GrepTool(BaseTool):
         path: str = ".",
         file_pattern: Optional[str] = None,
         case_insensitive: bool = False,
+        literal: bool = False,
         context_lines: int = 0,
         max_results: int = 100
     ) -> str:
         """Execute grep operation."""
         try:
-            target_path = Path(path).expanduser().resolve()
+            target_path = _resolve(path)
 
             if not target_path.exists():
                 return f"Error: Path '{path}' does not exist"
 
-            # Compile regex pattern
+            # Compile regex pattern (cached across invocations). Literal
+            # searches are escaped so the engine can use its fast
+            # fixed-string scan path.
             flags = re.IGNORECASE if case_insensitive else 0
+            source = re.escape(pattern) if literal else pattern
             try:
-                regex = re.compile(pattern, flags)
+                regex = _compile_pattern(source, flags)
             except re.error as e:
                 return f"Error: Invalid regex pattern: {e}"
 
-            results = []
-            total_matches = 0
-
-            def search_file(file_path: Path) -> None:
-                """Search for pattern in a single file."""
-                nonlocal total_matches
-
-                if total_matches >= max_results:
-                    return
-
+            # Bytes-mode twin of the pattern: scanning undecoded lines
+            # skips the UTF-8 decode for every non-matching line. Falls
+            # back to the str regex for patterns that only compile as
+            # text — and for case-insensitive non-ASCII patterns, since
+            # IGNORECASE on bytes only folds ASCII (b"über" would not
+            # match "Über").
+            if case_insensitive and not source.isascii():
+                regex_bytes = None
+            else:
                 try:
-                    # Skip binary files
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-
-                    matches = []
-                    for line_num, line in enumerate(lines, 1):
-                        if regex.search(line):
-                            matches.append((line_num, line.rstrip()))
-
-                    if matches:
-                        results.append(f"\n{file_path}:")
-                        for line_num, line in matches:
-                            if total_matches >= max_results:
-                                break
-
-                            results.append(f"  {line_num:4d}: {line}")
-
-                            # Add context lines
-                            if context_lines > 0:
-                                # Before context
-                                for i in range(max(0, line_num - context_lines - 1), line_num - 1):
-                                    if i < len(lines):
-                                        results.append(f"  {i+1:4d}- {lines[i].rstrip()}")
+                    regex_bytes = _compile_pattern(source.encode('utf-8'), flags)
+                except (re.error, UnicodeError):
+                    regex_bytes = None
 
-                                # After context
-                                for i in range(line_num, min(len(lines), line_num + context_lines)):
-                                    results.append(f"  {i+1:4d}- {lines[i].rstrip()}")
-
-                            total_matches += 1
-
-                except (UnicodeDecodeError, PermissionError):
-                    pass  # Skip files that can't be read
+            results = []
+            total_matches = 0
 
-            def search_directory(dir_path: Path) -> None:
-                """Recursively search directory."""
+            def search_file(file_path) -> tuple:
+                """Search one file; return (file header, match blocks)."""
+                blocks = []
                 try:
-                    for item in dir_path.iterdir():
-                        if total_matches >= max_results:
+                    # Skip oversized files and binaries cheaply: stat for
+                    # the size, then peek at the first 4 KiB for NUL bytes
+                    # instead of decoding the whole file first.
+                    if os.stat(file_path).st_size > _MAX_GREP_FILE_SIZE:
+                        return (f"\n{file_path}:", blocks)
+
+                    # Pull the raw bytes through a prefaulted mmap and
+                    # split once, instead of line-by-line buffered reads
+                    # through the text layer.
+                    with open(file_path, 'rb') as f:
+                        if b'\0' in f.read(_BINARY_PROBE_SIZE):
+                            return (f"\n{file_path}:", blocks)
+                        try:
+                            with _mmap_readonly(f.fileno()) as mapped:
+                                data = mapped[:]
+                        except ValueError:
+                            data = b''  # Empty files cannot be mapped
+
+                    if regex_bytes is not None:
+                        lines = data.splitlines()
+                        search = regex_bytes.search
+
+                        def line_text(i: int) -> str:
+                            return lines[i].decode('utf-8', errors='ignore').rstrip()
+                    else:
+                        lines = data.decode('utf-8', errors='ignore').splitlines()
+                        search = regex.search
+
+                        def line_text(i: int) -> str:
+                            return lines[i].rstrip()
+
+                    # Single pass: collect match blocks as they are found
+                    # and stop scanning once the match budget is spent, so
+                    # a huge file with early matches is not scanned to the
+                    # end. One block per match keeps the max_results cutoff
+                    # exact when per-file results are merged.
+                    for idx, line in enumerate(lines):
+                        if len(blocks) >= max_results:
                             break
 
-                        # Skip hidden files and common ignore patterns
-                        if item.name.startswith('.') or item.name in ['node_modules', '__pycache__', 'venv', '.git']:
+                        if not search(line):
                             continue
 
-                        if item.is_file():
-                            # Check file pattern filter
-                            if file_pattern:
-                                if not item.match(file_pattern):
-                                    continue
-                            search_file(item)
-                        elif item.is_dir():
-                            search_directory(item)
-
-                except PermissionError:
-                    pass
+                        line_num = idx + 1
+                        parts = [f"  {line_num:4d}: {line_text(idx)}"]
+
+                        # Add context lines
+                        if context_lines > 0:
+                            # Before context
+                            for i in range(max(0, line_num - context_lines - 1), line_num - 1):
+                                if i < len(lines):
+                                    parts.append(f"  {i+1:4d}- {line_text(i)}")
+
+                            # After context
+                            for i in range(line_num, min(len(lines), line_num + context_lines)):
+                                parts.append(f"  {i+1:4d}- {line_text(i)}")
+
+                        blocks.append("".join(parts))
+
+                except (UnicodeDecodeError, OSError):
+                    pass  # Skip files that can't be read or stat'd
+
+                return (f"\n{file_path}:", blocks)
+
+            # Translate the glob to a regex once, instead of re-parsing it
+            # through fnmatch for every file in the tree.
+            file_regex = _compile_pattern(fnmatch.translate(file_pattern), 0) if file_pattern else None
+
+            def collect_files(root) -> list:
+                """Gather candidate files, pruning ignored dirs up front."""
+                files = []
+                for dirpath, dirnames, filenames in os.walk(root, topdown=True, followlinks=False):
+                    # Prune before descent so ignored subtrees never cost
+                    # a readdir at all.
+                    dirnames[:] = [
+                        d for d in dirnames
+                        if not d.startswith('.') and d not in _IGNORED_DIRS
+                    ]
+                    for name in filenames:
+                        if name.startswith('.'):
+                            continue
+                        if file_regex is not None and not file_regex.match(name):
+                            continue
+                        files.append(os.path.join(dirpath, name))
+                return files
 
             # Determine if searching file or directory
             if target_path.is_file():
-                search_file(target_path)
+                per_file = [search_file(target_path)]
             else:
-                search_directory(target_path)
+                file_list = collect_files(target_path)
+                if len(file_list) > 3:
+                    # File scans are independent and I/O-bound, so fan
+                    # them out across threads; iterating futures in
+                    # submission order keeps output deterministic, and
+                    # not-yet-started files are cancelled once the match
+                    # budget is spent.
+                    per_file = []
+                    with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+                        futures = [pool.submit(search_file, p) for p in file_list]
+                        budget_left = max_results
+                        for future in futures:
+                            if budget_left <= 0:
+                                future.cancel()
+                                continue
+                            header, blocks = future.result()
+                            budget_left -= len(blocks[:budget_left])
+                            per_file.append((header, blocks))
+                else:
+                    per_file = [search_file(p) for p in file_list]
+
+            # Merge per-file blocks in traversal order, enforcing the
+            # global match budget exactly as the serial scan did.
+            for header, blocks in per_file:
+                if not blocks or total_matches >= max_results:
+                    continue
+                take = blocks[:max_results - total_matches]
+                results.append(header)
+                results.extend(take)
+                total_matches += len(take)
 
             if not results:
                 return f"No matches found for pattern '{pattern}'"
@@ -236,7 +486,7 @@ class TreeInput(BaseModel):
     dirs_only: bool = Field(default=False, description="Show only directories")
 
 
-class TreeTool(BaseTool):
+class TreeTool(ThreadedToolMixin, BaseTool):
     """Tool for displaying directory structure as a tree."""
 
     name: str = "tree"
@@ -252,7 +502,7 @@ class TreeTool(BaseTool):
     ) -> str:
         """Execute tree operation."""
         try:
-            target_path = Path(path).expanduser().resolve()
+            target_path = _resolve(path)
 
             if not target_path.exists():
                 return f"Error: Path '{path}' does not exist"
@@ -264,43 +514,63 @@ class TreeTool(BaseTool):
             dir_count = 0
             file_count = 0
 
-            def build_tree(dir_path: Path, prefix: str = "", depth: int = 0) -> None:
-                """Recursively build tree structure."""
-                nonlocal dir_count, file_count
-
+            def expand(dir_path, prefix: str, depth: int) -> list:
+                """List one directory as (entry, prefix, is_last, depth) frames."""
                 if max_depth is not None and depth >= max_depth:
-                    return
+                    return []
 
                 try:
-                    items = sorted(dir_path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-
-                    # Filter items
-                    if not show_hidden:
-                        items = [item for item in items if not item.name.startswith('.')]
-
-                    if dirs_only:
-                        items = [item for item in items if item.is_dir()]
-
-                    # Skip common ignored directories
-                    items = [item for item in items if item.name not in ['__pycache__', 'node_modules', '.git']]
-
-                    for i, item in enumerate(items):
-                        is_last = i == len(items) - 1
-                        current_prefix = "└── " if is_last else "├── "
-                        next_prefix = "    " if is_last else "│   "
-
-                        if item.is_dir():
-                            results.append(f"{prefix}{current_prefix}{item.name}/")
-                            dir_count += 1
-                            build_tree(item, prefix + next_prefix, depth + 1)
-                        else:
-                            results.append(f"{prefix}{current_prefix}{item.name}")
-                            file_count += 1
-
+                    # DirEntry.is_dir uses the readdir d_type, avoiding a
+                    # stat syscall per entry. Filter ignored/hidden
+                    # entries before sorting so pruned subtrees never pay
+                    # the sort-key cost.
+                    with os.scandir(dir_path) as it:
+                        items = [
+                            entry for entry in it
+                            if entry.name not in _IGNORED_DIRS
+                            and (show_hidden or not entry.name.startswith('.'))
+                            and (not dirs_only or entry.is_dir(follow_symlinks=False))
+                        ]
                 except PermissionError:
+                    # Marker frame: emitted as a [Permission Denied] line
+                    return [(None, prefix, False, depth)]
+
+                # Same decorate-sort-undecorate as LsTool: sort keys are
+                # computed once per entry, not per comparison.
+                decorated = [
+                    (not e.is_dir(follow_symlinks=False), e.name.lower(), i, e)
+                    for i, e in enumerate(items)
+                ]
+                decorated.sort()
+                items = [e for _, _, _, e in decorated]
+
+                last = len(items) - 1
+                return [(entry, prefix, i == last, depth) for i, entry in enumerate(items)]
+
+            # Explicit stack instead of recursion: each frame is one entry
+            # to emit, and a directory's children are pushed in reverse so
+            # LIFO pops reproduce the recursive preorder exactly — without
+            # a Python frame per directory or RecursionError on deep trees.
+            stack = expand(target_path, "", 0)
+            stack.reverse()
+            while stack:
+                entry, prefix, is_last, depth = stack.pop()
+
+                if entry is None:
                     results.append(f"{prefix}[Permission Denied]")
+                    continue
 
-            build_tree(target_path)
+                current_prefix = "└── " if is_last else "├── "
+                next_prefix = "    " if is_last else "│   "
+
+                if entry.is_dir(follow_symlinks=False):
+                    results.append(f"{prefix}{current_prefix}{entry.name}/")
+                    dir_count += 1
+                    children = expand(entry.path, prefix + next_prefix, depth + 1)
+                    stack.extend(reversed(children))
+                else:
+                    results.append(f"{prefix}{current_prefix}{entry.name}")
+                    file_count += 1
 
             summary = f"\n\n{dir_count} directories"
             if not dirs_only:
@@ -320,7 +590,7 @@ class BashInput(BaseModel):
     capture_stderr: bool = Field(default=True, description="Capture stderr along with stdout")
 
 
-class BashTool(BaseTool):
+class BashTool(ThreadedToolMixin, BaseTool):
     """Tool for executing bash commands.
 
     WARNING: This tool executes arbitrary bash commands and should be used with caution.
@@ -350,7 +620,7 @@ class BashTool(BaseTool):
 
             # Determine working directory
             if working_dir:
-                work_path = Path(working_dir).expanduser().resolve()
+                work_path = _resolve(working_dir)
                 if not work_path.exists():
                     return f"Error: Working directory '{working_dir}' does not exist"
                 if not work_path.is_dir():
@@ -359,50 +629,132 @@ class BashTool(BaseTool):
             else:
                 cwd = os.getcwd()
 
-            # Execute command
-            try:
-                result = subprocess.run(
-                    command,
-                    shell=True,
+            # Plain commands (no shell metacharacters) are exec'd
+            # directly; only commands that actually need shell features
+            # pay for the extra /bin/sh process.
+            needs_shell = any(c in _SHELL_METACHARS for c in command)
+            argv: Any = command
+            if not needs_shell:
+                argv = shlex.split(command)
+                # Env-assignment prefixes (FOO=bar cmd) are shell syntax
+                # even though they contain no metacharacters.
+                if not argv or "=" in argv[0]:
+                    needs_shell = True
+                    argv = command
+
+            def spawn(cmd, use_shell: bool):
+                # Stream output through pipes so memory stays O(cap)
+                # instead of O(command output).
+                return subprocess.Popen(
+                    cmd,
+                    shell=use_shell,
                     cwd=cwd,
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
                     text=True,
-                    timeout=timeout,
-                    env=os.environ.copy()
+                    # env omitted: the child inherits the parent environ
+                    # directly, without copying it into a fresh dict per
+                    # call.
                 )
 
-                # Build output
-                output_parts = []
+            try:
+                proc = spawn(argv, needs_shell)
+            except FileNotFoundError:
+                if needs_shell:
+                    return f"Error: Command not found or invalid shell command"
+                # Shell builtins like `cd` have no executable for exec to
+                # find; retry through /bin/sh so the fast path stays a
+                # pure optimization (a genuine typo then exits 127 with
+                # the shell's stderr, as before).
+                try:
+                    proc = spawn(command, True)
+                except FileNotFoundError:
+                    return f"Error: Command not found or invalid shell command"
+
+            def drain(stream) -> str:
+                """Read a pipe to EOF, retaining at most _MAX_BASH_OUTPUT."""
+                chunks = []
+                kept = 0
+                truncated = False
+                while True:
+                    chunk = stream.read(65536)
+                    if not chunk:
+                        break
+                    if kept < _MAX_BASH_OUTPUT:
+                        take = chunk[:_MAX_BASH_OUTPUT - kept]
+                        chunks.append(take)
+                        kept += len(take)
+                        truncated = len(take) < len(chunk)
+                    else:
+                        truncated = True
+                text = "".join(chunks)
+                if truncated:
+                    text += "\n...(output truncated)..."
+                return text
+
+            # Drain both pipes from background threads so the child never
+            # blocks on a full pipe, while the timeout is enforced here.
+            captured = {"out": "", "err": ""}
+            drainers = [
+                threading.Thread(
+                    target=lambda: captured.__setitem__("out", drain(proc.stdout)),
+                    daemon=True,
+                )
+            ]
+            if proc.stderr is not None:
+                drainers.append(
+                    threading.Thread(
+                        target=lambda: captured.__setitem__("err", drain(proc.stderr)),
+                        daemon=True,
+                    )
+                )
+            for t in drainers:
+                t.start()
+
+            try:
+                returncode = proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                # Orphaned grandchildren may keep the pipes open; the
+                # daemon drain threads are abandoned after a short grace
+                # period instead of blocking the tool on them.
+                for t in drainers:
+                    t.join(timeout=1)
+                return f"Error: Command timed out after {timeout} seconds"
 
-                # Add stdout
-                if result.stdout:
-                    output_parts.append("STDOUT:\n" + result.stdout.rstrip())
+            for t in drainers:
+                t.join()
 
-                # Add stderr if requested and present
-                if capture_stderr and result.stderr:
-                    if output_parts:
-                        output_parts.append("")  # Empty line separator
-                    output_parts.append("STDERR:\n" + result.stderr.rstrip())
+            stdout_text = captured["out"]
+            stderr_text = captured["err"]
 
-                # Add return code
+            # Build output
+            output_parts = []
+
+            # Add stdout
+            if stdout_text:
+                output_parts.append("STDOUT:\n" + stdout_text.rstrip())
+
+            # Add stderr if requested and present
+            if capture_stderr and stderr_text:
                 if output_parts:
                     output_parts.append("")  # Empty line separator
-                output_parts.append(f"Exit Code: {result.returncode}")
-
-                # If no output at all
-                if not result.stdout and not (capture_stderr and result.stderr):
-                    if result.returncode == 0:
-                        return f"Command completed successfully (no output)\nExit Code: 0"
-                    else:
-                        return f"Command failed with no output\nExit Code: {result.returncode}"
+                output_parts.append("STDERR:\n" + stderr_text.rstrip())
 
-                return "\n".join(output_parts)
+            # Add return code
+            if output_parts:
+                output_parts.append("")  # Empty line separator
+            output_parts.append(f"Exit Code: {returncode}")
 
-            except subprocess.TimeoutExpired:
-                return f"Error: Command timed out after {timeout} seconds"
+            # If no output at all
+            if not stdout_text and not (capture_stderr and stderr_text):
+                if returncode == 0:
+                    return f"Command completed successfully (no output)\nExit Code: 0"
+                else:
+                    return f"Command failed with no output\nExit Code: {returncode}"
 
-            except FileNotFoundError:
-                return f"Error: Command not found or invalid shell command"
+            return "\n".join(output_parts)
 
         except Exception as e:
             return f"Error: {str(e)}"
@@ -420,7 +772,7 @@ class EditInput(BaseModel):
     new_str: Optional[str] = Field(default=None, description="Replacement string in str_replace operation")
 
 
-class EditTool(BaseTool):
+class EditTool(ThreadedToolMixin, BaseTool):
     """Tool for viewing and editing text files.
 
     Supports four operations:
@@ -454,7 +806,7 @@ class EditTool(BaseTool):
     ) -> str:
         """Execute edit operation."""
         try:
-            path = Path(file_path).expanduser().resolve()
+            path = _resolve(file_path)
 
             if operation == "view":
                 return self._view(path, start_line, end_line)
@@ -479,39 +831,86 @@ class EditTool(BaseTool):
             if path.is_dir():
                 return f"Error: '{path}' is a directory, not a file"
 
-            # Read file
-            with open(path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            if not lines:
-                return f"File '{path}' is empty (0 lines)"
-
-            total_lines = len(lines)
+            # Serve repeat views from the content cache when the stat
+            # fingerprint still matches.
+            key = str(path)
+            entry = _FILE_CACHE.get(key)
+            if entry is not None:
+                st = path.stat()
+                if entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                    _FILE_CACHE.move_to_end(key)
+                    if not entry[2]:
+                        return f"File '{path}' is empty (0 lines)"
+                    all_lines = entry[2].split('\n')
+                    if all_lines[-1] == '':
+                        all_lines.pop()
+                    return self._render_view(path, all_lines, start_line, end_line)
+
+            # Map the file and locate the requested range by scanning
+            # newline offsets (memchr under the hood), so only the slice
+            # actually shown is decoded and split instead of the whole
+            # file.
+            with open(path, 'rb') as f:
+                try:
+                    mapped = _mmap_readonly(f.fileno())
+                except ValueError:
+                    return f"File '{path}' is empty (0 lines)"
+
+                with mapped:
+                    size = len(mapped)
+                    # mmap has no count(); tally newlines over bounded
+                    # chunk copies so memory stays O(chunk).
+                    total_lines = 0
+                    for chunk_start in range(0, size, 1 << 20):
+                        total_lines += mapped[chunk_start:chunk_start + (1 << 20)].count(b'\n')
+                    if mapped[size - 1] != 0x0A:  # no trailing newline
+                        total_lines += 1
+
+                    # Determine line range
+                    if start_line is None:
+                        start_line = 1
+                    if end_line is None:
+                        end_line = total_lines
+
+                    # Validate line numbers
+                    if start_line < 1:
+                        return f"Error: start_line must be >= 1 (got {start_line})"
+                    if end_line < start_line:
+                        return f"Error: end_line ({end_line}) must be >= start_line ({start_line})"
+                    if start_line > total_lines:
+                        return f"Error: start_line ({start_line}) exceeds file length ({total_lines} lines)"
+
+                    # Adjust end_line if it exceeds file length
+                    end_line = min(end_line, total_lines)
+
+                    # Walk newline offsets to the slice boundaries
+                    start_pos = 0
+                    for _ in range(start_line - 1):
+                        start_pos = mapped.find(b'\n', start_pos) + 1
+                    end_pos = start_pos
+                    for _ in range(end_line - start_line + 1):
+                        newline = mapped.find(b'\n', end_pos)
+                        if newline == -1:
+                            end_pos = size
+                            break
+                        end_pos = newline + 1
 
-            # Determine line range
-            if start_line is None:
-                start_line = 1
-            if end_line is None:
-                end_line = total_lines
+                    text = mapped[start_pos:end_pos].decode('utf-8')
 
-            # Validate line numbers
-            if start_line < 1:
-                return f"Error: start_line must be >= 1 (got {start_line})"
-            if end_line < start_line:
-                return f"Error: end_line ({end_line}) must be >= start_line ({start_line})"
-            if start_line > total_lines:
-                return f"Error: start_line ({start_line}) exceeds file length ({total_lines} lines)"
+                    # A whole-file view (the common no-args case) yields
+                    # the full content anyway; keep it for follow-up ops.
+                    if start_pos == 0 and end_pos == size:
+                        _cache_store(key, os.fstat(f.fileno()), text)
 
-            # Adjust end_line if it exceeds file length
-            end_line = min(end_line, total_lines)
+            lines = text.split('\n')
+            if lines and lines[-1] == '':
+                lines.pop()
 
             # Build output
             result = [f"File: {path} (lines {start_line}-{end_line} of {total_lines})", "=" * 70]
 
-            for i in range(start_line - 1, end_line):
-                line_num = i + 1
-                line_content = lines[i].rstrip('\n')
-                result.append(f"{line_num:4d} | {line_content}")
+            for offset, line_content in enumerate(lines):
+                result.append(f"{start_line + offset:4d} | {line_content}")
 
             return "\n".join(result)
 
@@ -520,6 +919,30 @@ class EditTool(BaseTool):
         except PermissionError:
             return f"Error: Permission denied reading '{path}'"
 
+    @staticmethod
+    def _render_view(path: Path, all_lines: List[str], start_line: Optional[int], end_line: Optional[int]) -> str:
+        """Render a view response from an already-split line list (cache hits)."""
+        total_lines = len(all_lines)
+
+        if start_line is None:
+            start_line = 1
+        if end_line is None:
+            end_line = total_lines
+
+        if start_line < 1:
+            return f"Error: start_line must be >= 1 (got {start_line})"
+        if end_line < start_line:
+            return f"Error: end_line ({end_line}) must be >= start_line ({start_line})"
+        if start_line > total_lines:
+            return f"Error: start_line ({start_line}) exceeds file length ({total_lines} lines)"
+
+        end_line = min(end_line, total_lines)
+
+        result = [f"File: {path} (lines {start_line}-{end_line} of {total_lines})", "=" * 70]
+        for offset, line_content in enumerate(all_lines[start_line - 1:end_line]):
+            result.append(f"{start_line + offset:4d} | {line_content}")
+        return "\n".join(result)
+
     def _create(self, path: Path, content: Optional[str]) -> str:
         """Create a new file."""
         try:
@@ -529,12 +952,20 @@ class EditTool(BaseTool):
             if path.exists():
                 return f"Error: File '{path}' already exists. Use str_replace or insert to modify existing files."
 
-            # Create parent directories if they don't exist
-            path.parent.mkdir(parents=True, exist_ok=True)
+            # Create parent directories if they don't exist, skipping the
+            # mkdir syscalls for directories ensured earlier this session
+            parent = str(path.parent)
+            if parent not in _MKDIR_SEEN:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                if len(_MKDIR_SEEN) >= _MKDIR_SEEN_MAX:
+                    _MKDIR_SEEN.pop(next(iter(_MKDIR_SEEN)))
+                _MKDIR_SEEN[parent] = None
 
             # Write file
             with open(path, 'w', encoding='utf-8') as f:
                 f.write(content)
+            # Drop any stale entry from a deleted file recreated at this path
+            _FILE_CACHE.pop(str(path), None)
 
             # Count lines for confirmation
             lines = content.split('\n')
@@ -559,11 +990,22 @@ class EditTool(BaseTool):
             if path.is_dir():
                 return f"Error: '{path}' is a directory, not a file"
 
-            # Read existing content
-            with open(path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            total_lines = len(lines)
+            # Count lines from the raw bytes so the append fast path can
+            # decide without decoding or retaining the file body.
+            size = 0
+            newlines = 0
+            last_byte = b''
+            with open(path, 'rb') as f:
+                chunk = f.read(_BINARY_PROBE_SIZE)
+                if b'\0' in chunk:
+                    return f"Error: File '{path}' is not a text file (binary content detected)"
+                while chunk:
+                    size += len(chunk)
+                    newlines += chunk.count(b'\n')
+                    last_byte = chunk[-1:]
+                    chunk = f.read(1 << 16)
+
+            total_lines = newlines + (1 if size and last_byte != b'\n' else 0)
 
             # Validate line number (1-based, can be total_lines + 1 to append)
             if line_number < 1:
@@ -576,6 +1018,18 @@ class EditTool(BaseTool):
             if not content.endswith('\n'):
                 content += '\n'
 
+            # Append fast path: the common "insert at end" case writes
+            # just the new content instead of rewriting the whole file.
+            if line_number == total_lines + 1:
+                with open(path, 'ab') as f:
+                    f.write(content.encode('utf-8'))
+                _FILE_CACHE.pop(str(path), None)
+                return f"Success: Inserted content at line {line_number} in '{path}' (now {total_lines + 1} lines)"
+
+            # Read existing content
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+
             # Insert at position (line_number - 1 is the index)
             insert_pos = line_number - 1
             lines.insert(insert_pos, content)
@@ -583,6 +1037,7 @@ class EditTool(BaseTool):
             # Write back
             with open(path, 'w', encoding='utf-8') as f:
                 f.writelines(lines)
+            _FILE_CACHE.pop(str(path), None)
 
             new_line_count = len(lines)
             return f"Success: Inserted content at line {line_number} in '{path}' (now {new_line_count} lines)"
@@ -606,23 +1061,36 @@ class EditTool(BaseTool):
             if path.is_dir():
                 return f"Error: '{path}' is a directory, not a file"
 
-            # Read file
-            with open(path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
+            # Read file (through the content cache; a preceding view of
+            # the same file makes this a dict hit)
+            original_content = _read_cached(path)
 
-            # Check if old_str exists
-            if old_str not in original_content:
+            # Single pass: splitting on old_str yields the occurrence
+            # count and the pieces to rejoin, instead of separate
+            # in-check, count and replace scans.
+            parts = original_content.split(old_str)
+            count = len(parts) - 1
+            if count == 0:
                 return f"Error: String '{old_str}' not found in '{path}'"
 
-            # Count occurrences
-            count = original_content.count(old_str)
-
-            # Perform replacement
-            new_content = original_content.replace(old_str, new_str)
+            new_content = new_str.join(parts)
 
-            # Write back
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            # Write atomically: temp file in the same directory, then
+            # os.replace, so a crash mid-write never leaves a truncated
+            # file behind.
+            fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(new_content)
+                os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+                os.replace(tmp_path, path)
+                _cache_store(str(path), os.stat(path), new_content)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
 
             return f"Success: Replaced {count} occurrence{'s' if count != 1 else ''} of '{old_str}' with '{new_str}' in '{path}'"
 
@@ -646,6 +1114,10 @@ class TodoPriority(str, Enum):
 class TodoItem(BaseModel):
     """Representation of a TODO item."""
 
+    # Frozen: items are immutable value objects, so instances are hashable
+    # and Pydantic skips the mutation machinery on them.
+    model_config = ConfigDict(frozen=True)
+
     id: int = Field(..., ge=0)
     content: str = Field(..., min_length=1)
     priority: TodoPriority = Field(default=TodoPriority.medium)
@@ -657,7 +1129,7 @@ class TodoInput(BaseModel):
     items: Optional[List[TodoItem]] = Field(default=None, description="List of todo items for 'write' operation")
 
 
-class TodoTool(BaseTool):
+class TodoTool(ThreadedToolMixin, BaseTool):
     """Tool for managing a simple todo list."""
 
     name: str = "todo"
@@ -668,13 +1140,15 @@ class TodoTool(BaseTool):
     )
     args_schema: type[BaseModel] = TodoInput
 
-    # Class variable to store todos across invocations
-    _todos: List[TodoItem] = []
+    # Class variable to store todos across invocations. A ClassVar tuple
+    # instead of a mutable pydantic field default: assignment goes through
+    # plain class attribute semantics rather than model validation.
+    _todos: ClassVar[tuple] = ()
 
     def _run(
         self,
         operation: str,
-        items: List[TodoItem],
+        items: Optional[List[TodoItem]] = None,
     ) -> str:
         """Execute todo operation."""
         try:
@@ -682,19 +1156,22 @@ class TodoTool(BaseTool):
                 if not items:
                     return "Error: 'item' is required for 'add' operation"
 
-                self._todos = items
+                TodoTool._todos = tuple(items)
                 return f"Success: write #{len(self._todos)} todos!"
 
             elif operation == "list":
                 if not self._todos:
                     return "Todo list is empty"
 
+                # Single pass: build the rows and tally completion together
+                # instead of re-scanning the list for the summary line.
                 result = ["Todo List:", "-" * 50]
+                completed = 0
                 for i, todo in enumerate(self._todos, 1):
-                    status = "✓" if todo.status == TodoStatus.completed else " "
-                    result.append(f"{i}. [{status}] {todo['text']}")
+                    done = todo.status == TodoStatus.completed
+                    completed += done
+                    result.append(f"{i}. [{'✓' if done else ' '}] {todo.content}")
 
-                completed = sum(1 for t in self._todos if t.status == TodoStatus.completed)
                 total = len(self._todos)
                 result.append("-" * 50)
                 result.append(f"Total: {total} items ({completed} completed, {total - completed} pending)")
@@ -709,11 +1186,17 @@ class TodoTool(BaseTool):
 
 
 # Convenience function to get all tools
-def get_file_system_tools() -> List[BaseTool]:
+@lru_cache(maxsize=1)
+def get_file_system_tools() -> tuple:
     """
-    Get a list of all file system tools.
+    Get the file system tools (built once, shared by all callers).
+
+    Instantiating a tool builds its pydantic schema and validators, so
+    the set is constructed on first call and returned as a shared tuple
+    instead of six fresh instances per caller. The tools are stateless
+    (TodoTool's state is class-level), so sharing is safe.
 
     Returns:
-        List of BaseTool instances (LsTool, GrepTool, TreeTool, BashTool, EditTool, TodoTool)
+        Tuple of BaseTool instances (LsTool, GrepTool, TreeTool, BashTool, EditTool, TodoTool)
     """
-    return [LsTool(), GrepTool(), TreeTool(), BashTool(), EditTool(), TodoTool()]
+    return (LsTool(), GrepTool(), TreeTool(), BashTool(), EditTool(), TodoTool())
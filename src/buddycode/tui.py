@@ -8,11 +8,102 @@ from textual.containers import Container, Vertical, Horizontal
 from textual.widgets import Header, Footer, Input, RichLog, Static
 from textual.binding import Binding
 from textual import work
+from rich.console import Group
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.text import Text
 import asyncio
-from buddycode.react_agent import create_coding_agent
+import json
+from collections import OrderedDict, deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    # Optional C-implemented serializer; the ReAct loop formats many
+    # small tool-arg dicts per turn, where orjson is several times
+    # faster than stdlib json.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Sentinel marking the end of an agent stream (see _stream_agent_response)
+_STREAM_DONE = object()
+
+
+_WELCOME_MD = """# Welcome to BuddyCode! 🤖
+
+An AI-powered coding assistant with file system tools.
+
+**Available Tools:**
+- 📁 `ls` - List files and directories
+- 🔍 `grep` - Search in files
+- 🌲 `tree` - Show directory structure
+- 💻 `bash` - Execute commands
+- ✏️  `edit` - Edit files
+- 📝 `todo_write` - Manage tasks
+
+**Quick Examples:**
+- "Show me the project structure"
+- "Find all TODO comments in Python files"
+- "Create a Button component in /tmp"
+- "Help me fix the bug in react_agent.py"
+
+Type your message below and press Enter to start!
+"""
+
+# Parsed once at import; on_mount runs on the UI-blocking mount path and
+# shouldn't pay for the Markdown parse before the input turns interactive.
+_WELCOME_PANEL = Panel(
+    Markdown(_WELCOME_MD),
+    title="[bold cyan]BuddyCode v0.1.0[/bold cyan]",
+    border_style="cyan"
+)
+
+
+class _LRUSet:
+    """Bounded set with LRU eviction, for streaming dedup keys.
+
+    The working set for dedup is only the current turn, so old entries
+    can be evicted instead of letting the set grow for the whole session.
+    """
+
+    def __init__(self, cap: int) -> None:
+        self._entries: OrderedDict = OrderedDict()
+        self._cap = cap
+
+    def __contains__(self, key) -> bool:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return True
+        return False
+
+    def add(self, key) -> None:
+        self._entries[key] = None
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._cap:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=64)
+def _md(content: str) -> Markdown:
+    """Parsed Markdown cache: values-mode streaming re-emits the same
+    accumulated content many times per turn, and Markdown renderables are
+    immutable once built."""
+    return Markdown(content)
+
+
+def create_coding_agent(*args, **kwargs):
+    """Build the coding agent, importing the agent stack on first use.
+
+    Importing langchain/langgraph eagerly would delay the TUI's first
+    paint by hundreds of milliseconds; init_agent calls this from a
+    worker thread, so both the import and the agent construction happen
+    off the UI thread.
+    """
+    from buddycode.react_agent import create_coding_agent as _create
+
+    return _create(*args, **kwargs)
 
 
 class MessageDisplay(RichLog):
@@ -91,10 +182,46 @@ class BuddyCodeTUI(App):
     TITLE = "BuddyCode - AI Coding Assistant"
     SUB_TITLE = "Powered by Doubao (豆包)"
 
+    # Size of the app-owned worker pool for blocking agent calls
+    ASYNC_MAX_WORKERS = 8
+
+    # Above this size, responses render as plain text: Rich's Markdown
+    # parser is O(tokens) and a single huge tool dump can stall the
+    # render thread for seconds.
+    MARKDOWN_MAX_CHARS = 5000
+
+    # Tool output shown per panel; anything beyond is summarized
+    TOOL_OUTPUT_MAX_CHARS = 500
+
+    # Shared encoder: json.dumps(indent=2, ...) builds a fresh
+    # JSONEncoder per call; default=str keeps the str() fallback for
+    # non-serializable values without exception-driven control flow.
+    _TOOL_ARG_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, sort_keys=False, default=str)
+
+    # Panel titles parsed from markup once instead of per write
+    _TITLE_YOU = Text.from_markup("[bold]You[/bold]")
+    _TITLE_AGENT = Text.from_markup("[bold green]🤖 Agent[/bold green]")
+
     def __init__(self):
         super().__init__()
         self.agent = None
         self.config = {"configurable": {"thread_id": "tui_session"}}
+        # App-owned pool instead of the loop's default executor: sized
+        # and named threads, not shared with whatever other libraries
+        # schedule on the loop.
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.ASYNC_MAX_WORKERS, thread_name_prefix="buddycode-tui"
+        )
+        # Panels produced by the streaming loop, drained at most once per
+        # frame so a burst of tool events costs one re-layout, not one
+        # per event.
+        self._pending_writes: deque = deque()
+        # Latest status from the streaming loop; applied by a debounced
+        # flusher so rapid tool fan-out doesn't re-render the status bar
+        # per event.
+        self._pending_status: str | None = None
+        # Dirty flag: scroll at most once per flush instead of per write
+        self._needs_scroll = False
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -115,31 +242,15 @@ class BuddyCodeTUI(App):
         self.status_bar = self.query_one(StatusBar)
         self.user_input = self.query_one("#user-input", Input)
 
-        # Show welcome message
-        self.messages.write(Panel(
-            Markdown("""# Welcome to BuddyCode! 🤖
+        # Show welcome message (pre-built at import time)
+        self.messages.write(_WELCOME_PANEL)
 
-An AI-powered coding assistant with file system tools.
-
-**Available Tools:**
-- 📁 `ls` - List files and directories
-- 🔍 `grep` - Search in files
-- 🌲 `tree` - Show directory structure
-- 💻 `bash` - Execute commands
-- ✏️  `edit` - Edit files
-- 📝 `todo_write` - Manage tasks
-
-**Quick Examples:**
-- "Show me the project structure"
-- "Find all TODO comments in Python files"
-- "Create a Button component in /tmp"
-- "Help me fix the bug in react_agent.py"
-
-Type your message below and press Enter to start!
-"""),
-            title="[bold cyan]BuddyCode v0.1.0[/bold cyan]",
-            border_style="cyan"
-        ))
+        # Drain queued panels once per frame (~60 fps); apply status
+        # changes at most 30 times a second. Both timers start paused and
+        # only tick while there is queued work, so an idle TUI does no
+        # periodic rendering at all.
+        self._batch_timer = self.set_interval(1 / 60, self._flush_pending, pause=True)
+        self._status_timer = self.set_interval(1 / 30, self._flush_status, pause=True)
 
         # Initialize agent in background
         self.init_agent()
@@ -147,6 +258,47 @@ Type your message below and press Enter to start!
         # Focus the input
         self.user_input.focus()
 
+    def _enqueue(self, renderable) -> None:
+        """Queue a renderable for the next per-frame flush."""
+        self._pending_writes.append(renderable)
+        self._needs_scroll = True
+        self._batch_timer.resume()
+
+    def _queue_status(self, status: str) -> None:
+        """Record a status change; only the latest survives to the flush."""
+        self._pending_status = status
+        self._status_timer.resume()
+
+    def _flush_status(self) -> None:
+        """Apply the most recent queued status, skipping no-op updates."""
+        status = self._pending_status
+        if status is None:
+            self._status_timer.pause()
+            return
+        self._pending_status = None
+        if status != self.status_bar.status:
+            self.status_bar.set_status(status)
+
+    def _flush_pending(self) -> None:
+        """Write all queued panels in one batched update per frame."""
+        if not self._pending_writes:
+            if self._needs_scroll:
+                self._needs_scroll = False
+                self.messages.scroll_end()
+            else:
+                self._batch_timer.pause()
+            return
+        pending = self._pending_writes
+        self._pending_writes = deque()
+        if len(pending) > 500:
+            self.log.warning(f"TUI flush backlog: {len(pending)} pending writes")
+        with self.batch_update():
+            for renderable in pending:
+                self.messages.write(renderable)
+            if self._needs_scroll:
+                self._needs_scroll = False
+                self.messages.scroll_end()
+
     @work(exclusive=True)
     async def init_agent(self) -> None:
         """Initialize the agent asynchronously."""
@@ -154,8 +306,8 @@ Type your message below and press Enter to start!
 
         try:
             # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            self.agent = await loop.run_in_executor(None, create_coding_agent)
+            loop = asyncio.get_running_loop()
+            self.agent = await loop.run_in_executor(self._executor, create_coding_agent)
             self.status_bar.set_status("Ready - Agent initialized ✓")
         except Exception as e:
             self.status_bar.set_status(f"Error: {e}")
@@ -177,7 +329,7 @@ Type your message below and press Enter to start!
         # Display user message
         self.messages.write(Panel(
             Text(user_message, style="bold cyan"),
-            title="[bold]You[/bold]",
+            title=self._TITLE_YOU,
             border_style="cyan"
         ))
 
@@ -192,42 +344,171 @@ Type your message below and press Enter to start!
         # Process with agent (don't await - @work decorator handles async)
         self.process_message(user_message)
 
+    def _agent_panel(self, body) -> Panel:
+        """Panel for AI responses (pre-parsed title, green border)."""
+        return Panel(body, title=self._TITLE_AGENT, border_style="green")
+
+    @staticmethod
+    def _tool_call_panel(body, tool_name: str) -> Panel:
+        """Panel for a tool invocation; the title Text skips markup parsing."""
+        return Panel(body, title=Text(f"Tool: {tool_name}", style="bold yellow"), border_style="yellow")
+
+    @staticmethod
+    def _tool_output_panel(body, tool_name: str) -> Panel:
+        """Panel for a tool result; the title Text skips markup parsing."""
+        return Panel(body, title=Text(f"Tool Output: {tool_name}", style="bold blue"), border_style="blue")
+
+    @staticmethod
+    def _message_key(msg):
+        """Stable identity for a streamed message.
+
+        values-mode streaming re-emits fresh objects for the same logical
+        message on every chunk, so id(msg) never matches and everything
+        gets reprocessed. Prefer the LangChain message id; fall back to a
+        cheap content-based key (prefix hash + length, plus tool-call
+        ids/names).
+        """
+        msg_id = getattr(msg, "id", None)
+        if msg_id is not None:
+            return msg_id
+        content = getattr(msg, "content", "") or ""
+        if not isinstance(content, str):
+            content = str(content)
+        tool_calls = getattr(msg, "tool_calls", None) or []
+        return (
+            getattr(msg, "type", None),
+            hash(content[:256]),
+            len(content),
+            tuple((tc.get("id"), tc.get("name")) for tc in tool_calls),
+        )
+
+    def _render_content(self, content: str):
+        """Markdown for normal-sized content, plain Text above the cap."""
+        if len(content) <= self.MARKDOWN_MAX_CHARS:
+            return _md(content)
+        return Group(
+            Text("[markdown rendering disabled for long output]", style="dim"),
+            Text(content),
+        )
+
     def _format_tool_args(self, args: dict) -> str:
         """Format tool arguments for display."""
-        import json
-        try:
-            return json.dumps(args, indent=2, ensure_ascii=False)
-        except Exception:
-            return str(args)
+        if not args:
+            return "{}"
+        if orjson is not None:
+            try:
+                return orjson.dumps(args, option=orjson.OPT_INDENT_2).decode()
+            except Exception:
+                pass  # non-serializable value; use the stdlib fallback
+        return self._TOOL_ARG_ENCODER.encode(args)
 
     async def _stream_agent_response(self, message: str):
-        """Generator that yields streaming chunks from the agent."""
-        loop = asyncio.get_event_loop()
-
-        # Create a generator that streams chunks
-        def stream_gen():
-            for chunk in self.agent.stream(
-                {"messages": [("user", message)]},
-                self.config,
-                stream_mode="values"
-            ):
-                yield chunk
-
-        # Yield chunks asynchronously
-        for chunk in await loop.run_in_executor(None, lambda: list(stream_gen())):
-            yield chunk
-            await asyncio.sleep(0)  # Allow UI to update
+        """Generator that yields streaming chunks from the agent.
+
+        The blocking agent.stream iterator runs in a worker thread and
+        pumps chunks through a bounded queue, so the UI renders each
+        chunk as it arrives instead of waiting for the whole trajectory;
+        the queue bound gives backpressure against a fast producer.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+        closed = [False]
+
+        def worker():
+            try:
+                for chunk in self.agent.stream(
+                    {"messages": [("user", message)]},
+                    self.config,
+                    stream_mode="values"
+                ):
+                    if closed[0]:
+                        return
+                    asyncio.run_coroutine_threadsafe(queue.put(chunk), loop).result()
+                asyncio.run_coroutine_threadsafe(queue.put(_STREAM_DONE), loop).result()
+            except BaseException as exc:  # re-raised on the consumer side
+                if not closed[0]:
+                    asyncio.run_coroutine_threadsafe(queue.put(exc), loop).result()
+
+        loop.run_in_executor(self._executor, worker)
+        try:
+            while True:
+                item = await queue.get()
+                if item is _STREAM_DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                # No explicit sleep(0): queue.get above is already a
+                # suspension point, so the UI gets scheduled per chunk.
+                yield item
+        finally:
+            # Unblock a producer stuck on a full queue, then let it see
+            # the closed flag and exit.
+            closed[0] = True
+            while not queue.empty():
+                queue.get_nowait()
+
+    def _handle_tool_calls(self, msg, seen_tool_calls: "_LRUSet") -> None:
+        """Display an AI message's tool calls (deduplicated by call id)."""
+        for tool_call in msg.tool_calls:
+            # LangChain assigns UUIDs; stringified args only as a fallback
+            tool_call_id = tool_call.get('id') or f"{tool_call.get('name', 'unknown')}_{str(tool_call.get('args', {}))}"
+            if tool_call_id in seen_tool_calls:
+                continue
+            seen_tool_calls.add(tool_call_id)
+
+            tool_name = tool_call.get('name', 'unknown')
+            tool_args = tool_call.get('args', {})
+
+            self._queue_status(f"Running tool: {tool_name}")
+
+            tool_display = f"🔧 **Tool Call:** `{tool_name}`\n\n```json\n{self._format_tool_args(tool_args)}\n```"
+            self._enqueue(self._tool_call_panel(
+                self._render_content(tool_display), tool_name
+            ))
+
+    def _handle_tool_output(self, msg) -> None:
+        """Display a tool response, truncating long outputs."""
+        tool_name = getattr(msg, 'name', 'tool')
+        tool_content = msg.content
+
+        # Slice before building the renderable so a multi-MB dump is
+        # never materialized inside the panel; plain Text skips the
+        # markup/code-fence parsing Rich would otherwise run over it.
+        n = len(tool_content)
+        max_length = self.TOOL_OUTPUT_MAX_CHARS
+        body = tool_content if n <= max_length else f"{tool_content[:max_length]}\n... (truncated, {n} chars total)"
+
+        self._enqueue(self._tool_output_panel(
+            Text(body, no_wrap=False, overflow="fold"), tool_name
+        ))
+
+    def _handle_ai_text(self, content: str, last_ai_content: str) -> str:
+        """Display new AI text; returns the content now on screen."""
+        if content == last_ai_content:
+            return last_ai_content
+
+        self._queue_status("Agent responding...")
+
+        # When the new content extends what is already on screen (values
+        # mode re-emits the accumulated text), append just the delta
+        # instead of re-parsing and re-rendering the whole growing string.
+        if last_ai_content and content.startswith(last_ai_content):
+            self._enqueue(self._render_content(content[len(last_ai_content):]))
+        else:
+            self._enqueue(self._agent_panel(self._render_content(content)))
+        return content
 
     @work(exclusive=True)
     async def process_message(self, message: str) -> None:
         """Process message with the agent using streaming."""
-        self.status_bar.set_status("Agent is thinking...")
+        self._queue_status("Agent is thinking...")
 
         try:
-            # Track processed messages to avoid duplicates
-            processed_message_ids = set()
+            # Track processed messages to avoid duplicates; bounded per
+            # turn so a long trajectory can't grow the sets unboundedly
+            processed_message_ids = _LRUSet(256)
             last_ai_content = ""
-            seen_tool_calls = set()
+            seen_tool_calls = _LRUSet(256)
 
             # Process streaming chunks
             async for chunk in self._stream_agent_response(message):
@@ -236,81 +517,39 @@ Type your message below and press Enter to start!
                     # Process all messages in chunk (in case multiple arrived)
                     for msg in chunk["messages"]:
                         # Generate a message ID to avoid duplicates
-                        msg_id = id(msg)
+                        msg_id = self._message_key(msg)
                         if msg_id in processed_message_ids:
                             continue
 
                         processed_message_ids.add(msg_id)
 
-                        # Handle AI messages with tool calls
-                        if hasattr(msg, 'tool_calls') and msg.tool_calls:
-                            for tool_call in msg.tool_calls:
-                                # Create unique ID for tool call
-                                tool_call_id = f"{tool_call.get('name', 'unknown')}_{str(tool_call.get('args', {}))}"
-                                if tool_call_id in seen_tool_calls:
-                                    continue
-                                seen_tool_calls.add(tool_call_id)
-
-                                tool_name = tool_call.get('name', 'unknown')
-                                tool_args = tool_call.get('args', {})
-
-                                self.status_bar.set_status(f"Running tool: {tool_name}")
-
-                                # Display tool call
-                                tool_display = f"🔧 **Tool Call:** `{tool_name}`\n\n```json\n{self._format_tool_args(tool_args)}\n```"
-                                self.messages.write(Panel(
-                                    Markdown(tool_display),
-                                    title=f"[bold yellow]Tool: {tool_name}[/bold yellow]",
-                                    border_style="yellow"
-                                ))
-                                self.messages.scroll_end()
-
-                        # Handle tool responses
-                        elif hasattr(msg, 'type') and msg.type == 'tool':
-                            tool_name = getattr(msg, 'name', 'tool')
-                            tool_content = msg.content
-
-                            # Truncate long outputs
-                            max_length = 500
-                            if len(tool_content) > max_length:
-                                tool_content = tool_content[:max_length] + f"\n... (truncated, {len(tool_content)} chars total)"
-
-                            self.messages.write(Panel(
-                                f"```\n{tool_content}\n```",
-                                title=f"[bold blue]Tool Output: {tool_name}[/bold blue]",
-                                border_style="blue"
-                            ))
-                            self.messages.scroll_end()
-
-                        # Handle AI text content (final response)
-                        elif hasattr(msg, 'content') and msg.content and hasattr(msg, 'type') and msg.type == 'ai':
-                            content = msg.content
-
-                            # Only display if this is new content
-                            if content and content != last_ai_content:
-                                last_ai_content = content
-                                self.status_bar.set_status("Agent responding...")
-
-                                # Display the response
-                                self.messages.write(Panel(
-                                    Markdown(content),
-                                    title="[bold green]🤖 Agent[/bold green]",
-                                    border_style="green"
-                                ))
-                                self.messages.scroll_end()
-
-            self.status_bar.set_status("Ready")
+                        # Single dispatch on the message type instead of
+                        # repeated hasattr probes per message per chunk
+                        mtype = getattr(msg, 'type', None)
+                        if getattr(msg, 'tool_calls', None):
+                            self._handle_tool_calls(msg, seen_tool_calls)
+                        elif mtype == 'tool':
+                            self._handle_tool_output(msg)
+                        elif mtype == 'ai' and getattr(msg, 'content', None):
+                            last_ai_content = self._handle_ai_text(msg.content, last_ai_content)
+
+            self._queue_status("Ready")
 
         except Exception as e:
-            self.messages.write(Panel(
+            self._enqueue(Panel(
                 f"[bold red]Error:[/bold red]\n{str(e)}",
                 border_style="red"
             ))
-            self.status_bar.set_status("Error occurred")
+            self._queue_status("Error occurred")
 
         finally:
-            # Scroll to bottom
-            self.messages.scroll_end()
+            # Ensure the next flush scrolls to the bottom of the turn
+            self._needs_scroll = True
+            self._batch_timer.resume()
+
+    def on_unmount(self) -> None:
+        """Tear down the worker pool when the app exits."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     def action_clear(self) -> None:
         """Clear the message display."""
@@ -4,51 +4,60 @@ Test LangGraph Server
 
 Quick test to verify the LangGraph dev server is running correctly.
 """
-import requests
-import json
+import asyncio
+
+import httpx
+import orjson
 
 BASE_URL = "http://localhost:8123"
 
-def test_server():
+async def test_server():
     print("=" * 70)
     print("Testing LangGraph Development Server")
     print("=" * 70)
 
+    # The two probes are independent, so fire them concurrently over one
+    # keep-alive client: wall time is max(t1, t2) instead of t1 + t2.
+    # Explicit timeouts keep a dead server from hanging the test run.
+    # (http2 is skipped: the dev server speaks HTTP/1.1 and the h2 extra
+    # is not a dependency.)
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=5) as client:
+        try:
+            info_response, search_response = await asyncio.gather(
+                client.get("/info"),
+                client.post(
+                    "/assistants/search",
+                    content=b"{}",
+                    headers={"Content-Type": "application/json"},
+                ),
+            )
+        except Exception as e:
+            print(f"✗ Error: {e}")
+            return False
+
     # Test 1: Server info
     print("\n[1/2] Testing server info endpoint...")
-    try:
-        response = requests.get(f"{BASE_URL}/info")
-        if response.status_code == 200:
-            info = response.json()
-            print(f"✓ Server is running!")
-            print(f"  Version: {info['version']}")
-            print(f"  LangGraph Python: {info['langgraph_py_version']}")
-        else:
-            print(f"✗ Unexpected status: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"✗ Error: {e}")
+    if info_response.status_code == 200:
+        # orjson decodes the payload in Rust, ~2-3x faster than stdlib json.
+        info = orjson.loads(info_response.content)
+        print(f"✓ Server is running!")
+        print(f"  Version: {info['version']}")
+        print(f"  LangGraph Python: {info['langgraph_py_version']}")
+    else:
+        print(f"✗ Unexpected status: {info_response.status_code}")
         return False
 
     # Test 2: List assistants
     print("\n[2/2] Checking for coding_agent...")
-    try:
-        # The endpoint might be /assistants/search with POST
-        response = requests.post(
-            f"{BASE_URL}/assistants/search",
-            json={}
-        )
-        if response.status_code == 200:
-            assistants = response.json()
-            print(f"✓ Found {len(assistants)} assistant(s)")
-            for assistant in assistants:
-                print(f"  - {assistant.get('assistant_id', 'unknown')}")
-                if assistant.get('assistant_id') == 'coding_agent':
-                    print("    ✓ coding_agent is registered!")
-        else:
-            print(f"  Status: {response.status_code}")
-    except Exception as e:
-        print(f"  Note: {e}")
+    if search_response.status_code == 200:
+        assistants = orjson.loads(search_response.content)
+        print(f"✓ Found {len(assistants)} assistant(s)")
+        for assistant in assistants:
+            print(f"  - {assistant.get('assistant_id', 'unknown')}")
+            if assistant.get('assistant_id') == 'coding_agent':
+                print("    ✓ coding_agent is registered!")
+    else:
+        print(f"  Status: {search_response.status_code}")
 
     print("\n" + "=" * 70)
     print("Server Test Complete!")
@@ -59,4 +68,4 @@ def test_server():
     return True
 
 if __name__ == "__main__":
-    test_server()
+    asyncio.run(test_server())